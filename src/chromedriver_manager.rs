@@ -8,6 +8,8 @@ use tokio::sync::Mutex;
 pub struct ChromeDriverManager {
     driver_path: PathBuf,
     process: Arc<Mutex<Option<Child>>>,
+    // Shared so version lookup, download and readiness checks reuse connections
+    http_client: reqwest::Client,
 }
 
 impl ChromeDriverManager {
@@ -23,6 +25,7 @@ impl ChromeDriverManager {
         Self {
             driver_path,
             process: Arc::new(Mutex::new(None)),
+            http_client: reqwest::Client::new(),
         }
     }
 
@@ -102,17 +105,11 @@ impl ChromeDriverManager {
         );
 
         // Download the file
-        let response = reqwest::get(&download_url).await?;
+        let response = self.http_client.get(&download_url).send().await?;
         let zip_data = response.bytes().await?;
 
-        // Save to temp file
-        let temp_dir = std::env::temp_dir();
-        let zip_path = temp_dir.join("chromedriver.zip");
-        fs::write(&zip_path, zip_data)?;
-
-        // Extract the zip
-        let file = fs::File::open(&zip_path)?;
-        let mut archive = zip::ZipArchive::new(file)?;
+        // Extract the zip straight from memory
+        let mut archive = zip::ZipArchive::new(std::io::Cursor::new(zip_data))?;
 
         for i in 0..archive.len() {
             let mut file = archive.by_index(i)?;
@@ -126,21 +123,17 @@ impl ChromeDriverManager {
             }
         }
 
-        // Clean up temp file
-        let _ = fs::remove_file(&zip_path);
-
         println!("ChromeDriver downloaded to {:?}", self.driver_path);
         Ok(())
     }
 
     async fn wait_for_readiness(&self, port: u16, timeout_secs: u64) -> Result<bool> {
-        let client = reqwest::Client::new();
         let url = format!("http://localhost:{}/status", port);
         let timeout = tokio::time::Duration::from_secs(timeout_secs);
         let start = tokio::time::Instant::now();
 
         while start.elapsed() < timeout {
-            match client.get(&url).send().await {
+            match self.http_client.get(&url).send().await {
                 Ok(response) => {
                     if response.status().is_success() {
                         return Ok(true);
@@ -159,7 +152,8 @@ impl ChromeDriverManager {
     async fn get_latest_version(&self) -> Result<String> {
         // For Chrome 140+, we need to use the new ChromeDriver endpoint
         // Chrome versions 115+ use a different versioning system
-        let response = reqwest::get("https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_STABLE")
+        let response = self.http_client.get("https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_STABLE")
+            .send()
             .await?;
         let version = response.text().await?.trim().to_string();
         println!("Latest ChromeDriver version: {}", version);
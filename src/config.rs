@@ -2,7 +2,7 @@ use anyhow::Result;
 use directories::ProjectDirs;
 use serde::{Deserialize, Serialize};
 use std::fs;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 use crate::crypto::{EncryptedPassword, PasswordCrypto};
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -96,6 +96,11 @@ impl AppConfig {
     pub fn save(&self) -> Result<()> {
         let config_path = Self::config_path()?;
 
+        // The settings UI saves on every change, most of which leave the file as is
+        if self.matches_saved(&config_path) {
+            return Ok(());
+        }
+
         if let Some(parent) = config_path.parent() {
             fs::create_dir_all(parent)?;
         }
@@ -105,11 +110,45 @@ impl AppConfig {
         config_to_save.encrypt_password_for_save()?;
 
         let content = serde_json::to_string_pretty(&config_to_save)?;
-        fs::write(&config_path, content)?;
+
+        // Write to a temporary file and rename it so the config is never left half-written
+        let temp_path = config_path.with_extension("json.tmp");
+        fs::write(&temp_path, content)?;
+        fs::rename(&temp_path, &config_path)?;
 
         Ok(())
     }
 
+    /// Check whether the config on disk already holds these settings.
+    /// The encrypted password gets a new nonce on every save, so it is compared decrypted.
+    fn matches_saved(&self, config_path: &Path) -> bool {
+        let Ok(content) = fs::read_to_string(config_path) else {
+            return false;
+        };
+        let Ok(mut saved) = serde_json::from_str::<Self>(&content) else {
+            return false;
+        };
+        // A legacy plaintext password is only migrated in memory on load; it has to be
+        // rewritten in encrypted form even if the settings are otherwise unchanged
+        if let Some(saved_password) = &saved.password_encrypted {
+            if !PasswordCrypto::is_likely_encrypted(saved_password) {
+                return false;
+            }
+        }
+        if saved.load_password().is_err() || saved.password_plaintext != self.password_plaintext {
+            return false;
+        }
+
+        let mut current = self.clone();
+        saved.password_encrypted = None;
+        current.password_encrypted = None;
+
+        match (serde_json::to_value(&saved), serde_json::to_value(&current)) {
+            (Ok(saved_value), Ok(current_value)) => saved_value == current_value,
+            _ => false,
+        }
+    }
+
     /// Encrypt the plaintext password for JSON serialization
     fn encrypt_password_for_save(&mut self) -> Result<()> {
         if !self.password_plaintext.is_empty() {
@@ -172,4 +211,48 @@ impl AppConfig {
 
         errors
     }
-}
\ No newline at end of file
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn temp_config_path(name: &str) -> PathBuf {
+        std::env::temp_dir().join(format!("eview_scraper_{}_{}.json", name, std::process::id()))
+    }
+
+    #[test]
+    fn test_matches_saved_rejects_legacy_plaintext_password() {
+        let path = temp_config_path("legacy");
+
+        // Config file as written before passwords were encrypted
+        let mut legacy = AppConfig::default();
+        legacy.password_encrypted = Some("secret".to_string());
+        fs::write(&path, serde_json::to_string_pretty(&legacy).unwrap()).unwrap();
+
+        // What load() produces from that file: same settings, password migrated in memory
+        let mut loaded: AppConfig = serde_json::from_str(&fs::read_to_string(&path).unwrap()).unwrap();
+        loaded.load_password().unwrap();
+        assert_eq!(loaded.password(), "secret");
+
+        assert!(!loaded.matches_saved(&path));
+        fs::remove_file(&path).unwrap();
+    }
+
+    #[test]
+    fn test_matches_saved_accepts_unchanged_encrypted_config() {
+        let path = temp_config_path("encrypted");
+
+        let mut config = AppConfig::default();
+        config.set_password("secret".to_string());
+        let mut to_save = config.clone();
+        to_save.encrypt_password_for_save().unwrap();
+        fs::write(&path, serde_json::to_string_pretty(&to_save).unwrap()).unwrap();
+
+        assert!(config.matches_saved(&path));
+
+        config.project_number = "4711".to_string();
+        assert!(!config.matches_saved(&path));
+        fs::remove_file(&path).unwrap();
+    }
+}
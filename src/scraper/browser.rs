@@ -1,7 +1,32 @@
 use anyhow::{Result, Context};
+use thirtyfour::extensions::cdp::ChromeDevTools;
 use thirtyfour::prelude::*;
+use thirtyfour::{CapabilitiesHelper, PageLoadStrategy};
 use tokio::time::{sleep, Duration};
 
+// Resources the extraction never looks at. SVG is deliberately not listed because
+// the PLC diagrams are rendered as SVG.
+const BLOCKED_URL_PATTERNS: &[&str] = &[
+    "*.woff", "*.woff2", "*.ttf",
+    "*.png", "*.jpg", "*.jpeg", "*.gif",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+    "*bing.com/insights*", "*clarity.ms*",
+];
+
+/// Whether a running Chrome holds the profile in `profile_dir`. On Windows Chrome keeps
+/// `lockfile` open (a stale one can be deleted); elsewhere it creates a `SingletonLock` link.
+fn profile_in_use(profile_dir: &std::path::Path) -> bool {
+    let lockfile = profile_dir.join("lockfile");
+    if lockfile.exists() && std::fs::remove_file(&lockfile).is_err() {
+        return true;
+    }
+    std::fs::symlink_metadata(profile_dir.join("SingletonLock")).is_ok()
+}
+
+/// Thin wrapper around the WebDriver session.
+///
+/// The implicit wait is kept at zero for the lifetime of the session so that the
+/// explicit `wait_for_*` helpers poll at network round-trip speed.
 pub struct BrowserDriver {
     driver: WebDriver,
 }
@@ -28,12 +53,29 @@ impl BrowserDriver {
             chrome_args.push("--headless".to_string());
         }
 
+        // Keep a persistent profile so the SSO cookies and HTTP cache survive between runs.
+        // A browser left open (e.g. by debug mode after an error) still holds it; Chrome would
+        // fail to start on it, so use ChromeDriver's temporary profile for this run instead.
+        if let Some(proj_dirs) = directories::ProjectDirs::from("com", "eplan", "eview-scraper") {
+            let profile_dir = proj_dirs.data_local_dir().join("chrome-profile");
+            if profile_in_use(&profile_dir) {
+                println!("DEBUG: BrowserDriver::new() - Chrome profile {} is in use, using a temporary profile", profile_dir.display());
+            } else {
+                chrome_args.push(format!("--user-data-dir={}", profile_dir.display()));
+                chrome_args.push("--profile-directory=Default".to_string());
+            }
+        }
+
         // Add Chrome arguments to capabilities
         let args_count = chrome_args.len();
         for arg in chrome_args {
             caps.add_arg(&arg)?;
         }
 
+        // Return from navigation at DOMContentLoaded instead of waiting for every
+        // analytics beacon that runs on load
+        caps.set_page_load_strategy(PageLoadStrategy::Eager)?;
+
         println!("DEBUG: BrowserDriver::new() - Chrome capabilities created with {} args", args_count);
 
         // Connect to ChromeDriver with reduced retry logic
@@ -43,7 +85,20 @@ impl BrowserDriver {
             match WebDriver::new("http://localhost:9516", caps.clone()).await {
                 Ok(driver) => {
                     println!("DEBUG: BrowserDriver::new() - Successfully connected to ChromeDriver");
-                    return Ok(Self { driver });
+
+                    // All waiting is done with explicit waits; a non-zero implicit wait
+                    // would be paid again on every poll of those waits
+                    driver.set_implicit_wait_timeout(Duration::ZERO).await
+                        .context("Failed to disable implicit wait")?;
+
+                    // Batched page extraction runs as one asynchronous script per batch of
+                    // pages, which takes longer than the 30s WebDriver default
+                    driver.set_script_timeout(Duration::from_secs(180)).await
+                        .context("Failed to set script timeout")?;
+
+                    let browser = Self { driver };
+                    browser.block_unneeded_resources().await;
+                    return Ok(browser);
                 }
                 Err(e) => {
                     println!("DEBUG: BrowserDriver::new() - Attempt {} failed: {}", attempt, e);
@@ -61,6 +116,25 @@ impl BrowserDriver {
             .context("Failed to connect to ChromeDriver after 3 attempts. ChromeDriver should have been started automatically on port 9516")
     }
 
+    /// Blocks fonts, raster images and analytics requests through the DevTools protocol.
+    /// Not fatal if it fails, the pages just load everything as before.
+    async fn block_unneeded_resources(&self) {
+        let dev_tools = ChromeDevTools::new(self.driver.handle.clone());
+        let result = async {
+            dev_tools.execute_cdp("Network.enable").await?;
+            dev_tools.execute_cdp_with_params(
+                "Network.setBlockedURLs",
+                serde_json::json!({ "urls": BLOCKED_URL_PATTERNS }),
+            ).await?;
+            Ok::<(), anyhow::Error>(())
+        }.await;
+
+        match result {
+            Ok(_) => println!("DEBUG: BrowserDriver::new() - Blocking {} non-essential URL patterns", BLOCKED_URL_PATTERNS.len()),
+            Err(e) => println!("DEBUG: BrowserDriver::new() - Could not block non-essential resources: {}", e),
+        }
+    }
+
     pub async fn navigate(&self, url: &str) -> Result<()> {
         self.driver.goto(url).await?;
         Ok(())
@@ -76,19 +150,51 @@ impl BrowserDriver {
     }
 
     pub async fn wait_for_element(&self, selector: By, timeout_secs: u64) -> Result<WebElement> {
+        self.driver
+            .query(selector)
+            .wait(Duration::from_secs(timeout_secs), Duration::from_millis(250))
+            .first()
+            .await
+            .context("Timeout waiting for element")
+    }
+
+    /// Waits until an element matching `selector` is displayed and enabled.
+    /// Returns as soon as the element is ready instead of sleeping a fixed interval.
+    /// Relies on the implicit wait being zero (see [`BrowserDriver::new`]).
+    pub async fn wait_for_clickable(&self, selector: By, timeout_secs: u64) -> Result<WebElement> {
+        self.driver
+            .query(selector)
+            .wait(Duration::from_secs(timeout_secs), Duration::from_millis(250))
+            .and_clickable()
+            .first()
+            .await
+            .context("Timeout waiting for clickable element")
+    }
+
+    /// Returns the first element matching `selector` that is displayed and enabled right now.
+    pub async fn find_clickable_now(&self, selector: By) -> Result<Option<WebElement>> {
+        Ok(self.driver.query(selector).nowait().and_clickable().first_opt().await?)
+    }
+
+    /// Waits until `condition` holds for the current URL and returns that URL.
+    pub async fn wait_for_url<F>(&self, condition: F, timeout_secs: u64) -> Result<String>
+    where
+        F: Fn(&str) -> bool,
+    {
         let timeout = Duration::from_secs(timeout_secs);
         let start = std::time::Instant::now();
 
         loop {
-            if let Ok(element) = self.driver.find(selector.clone()).await {
-                return Ok(element);
+            let url = self.get_current_url().await?;
+            if condition(&url) {
+                return Ok(url);
             }
 
             if start.elapsed() > timeout {
-                return Err(anyhow::anyhow!("Timeout waiting for element"));
+                return Err(anyhow::anyhow!("Timeout waiting for URL change"));
             }
 
-            sleep(Duration::from_millis(500)).await;
+            sleep(Duration::from_millis(250)).await;
         }
     }
 
@@ -103,6 +209,18 @@ impl BrowserDriver {
         Ok(())
     }
 
+    /// Sets an input's value in one script call instead of typing it key by key.
+    /// Uses the native setter and fires `input`/`change` so frameworks that track the
+    /// field (e.g. to enable the Next button) see the new value.
+    pub async fn set_input_value(&self, element: &WebElement, value: &str) -> Result<()> {
+        let script = "const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set; \
+            setter.call(arguments[0], arguments[1]); \
+            arguments[0].dispatchEvent(new Event('input', { bubbles: true })); \
+            arguments[0].dispatchEvent(new Event('change', { bubbles: true }));";
+        self.driver.execute(script, vec![serde_json::json!(element), serde_json::json!(value)]).await?;
+        Ok(())
+    }
+
     pub async fn get_page_source(&self) -> Result<String> {
         Ok(self.driver.source().await?)
     }
@@ -133,6 +251,21 @@ impl BrowserDriver {
         }
     }
 
+    pub async fn execute_script_with_args(&self, script: &str, args: Vec<serde_json::Value>) -> Result<serde_json::Value> {
+        match self.driver.execute(script, args).await {
+            Ok(value) => Ok(value.json().clone()),
+            Err(e) => Err(anyhow::anyhow!("Script execution failed: {}", e)),
+        }
+    }
+
+    /// Runs an asynchronous script; it finishes by calling the callback passed as its last argument.
+    pub async fn execute_async_script_with_args(&self, script: &str, args: Vec<serde_json::Value>) -> Result<serde_json::Value> {
+        match self.driver.execute_async(script, args).await {
+            Ok(value) => Ok(value.json().clone()),
+            Err(e) => Err(anyhow::anyhow!("Async script execution failed: {}", e)),
+        }
+    }
+
     pub async fn quit(&self) -> Result<()> {
         // Clone the driver to move it into quit()
         let driver_clone = self.driver.clone();
@@ -4,15 +4,195 @@ pub mod extractor;
 use anyhow::Result;
 use crate::models::{PlcTable, PlcEntry};
 use crate::chromedriver_manager::ChromeDriverManager;
-use std::sync::Arc;
+use serde::Deserialize;
+use std::sync::{Arc, OnceLock};
 use tokio::sync::Mutex;
 
+// Microsoft login selectors from Python, combined into one CSS selector list each
+// so a single lookup covers every variant
+const EMAIL_CSS: &str = "input[type='email'], input[name='loginfmt'], input[id='i0116'], input[id='email'], \
+    input[placeholder*='Email'], input[placeholder*='E-Mail'], input[name='username']";
+const NEXT_BUTTON_CSS: &str = "input[type='submit'], input[id='idSIButton9'], button[type='submit'], \
+    input[value='Next'], input[value='Weiter'], button[id='idSIButton9']";
+const PASSWORD_CSS: &str = "input[type='password'], input[name='passwd'], input[id='i0118'], \
+    input[id='passwordInput'], input[placeholder*='Password'], input[placeholder*='Passwort']";
+const SIGNIN_BUTTON_CSS: &str = "input[type='submit'], input[id='idSIButton9'], button[type='submit'], \
+    input[value='Sign in'], input[value='Anmelden'], button[id='idSIButton9']";
+const STAY_SIGNED_IN_CSS: &str = "input[id='idSIButton9'], input[value='Yes'], input[value='Ja'], button[id='idSIButton9']";
+
+// Page toolbar controls for switching the page navigator to the list view
+const THREE_DOTS_CSS: &str = "eplan-icon-button[data-t*='ev-btn-page-more']:not(.fl-pop-up-open)";
+const THREE_DOTS_OPEN_CSS: &str = "eplan-icon-button[data-t*='ev-btn-page-more'].fl-pop-up-open";
+const LIST_VIEW_ITEM_CSS: &str = "eplan-dropdown-item[data-name*='ev-page-list-view-btn']";
+
+// Collects text, value and state of every button in one script call instead of
+// several WebDriver round-trips per button
+const BUTTON_INFO_JS: &str = "return Array.from(document.querySelectorAll('button')).map(b => ({ \
+    text: (b.innerText || '').trim(), value: b.value || '', \
+    visible: b.offsetParent !== null, enabled: !b.disabled }));";
+
+#[derive(Debug, Deserialize)]
+struct ButtonInfo {
+    text: String,
+    value: String,
+    visible: bool,
+    enabled: bool,
+}
+
+/// Label of the project's 'Open' button in German or English.
+fn open_button_regex() -> &'static regex::Regex {
+    static OPEN_BUTTON: OnceLock<regex::Regex> = OnceLock::new();
+    OPEN_BUTTON.get_or_init(|| regex::Regex::new(r"(?i)öffnen|open").unwrap())
+}
+
+/// Diagram texts that are never PLC data (Python skip list, line 1050-1052).
+fn skip_text_regex() -> &'static regex::Regex {
+    static SKIP_TEXT: OnceLock<regex::Regex> = OnceLock::new();
+    SKIP_TEXT.get_or_init(|| regex::Regex::new(r"Date|Datum|ET 200SP").unwrap())
+}
+
+/// PLC I/O address such as `I12.3`, `QW64` (regex from Python).
+fn address_regex() -> &'static regex::Regex {
+    static ADDRESS: OnceLock<regex::Regex> = OnceLock::new();
+    ADDRESS.get_or_init(|| regex::Regex::new(r"\b([IQ]W?\d+\.\d+|[IQ]W\d+)\b").unwrap())
+}
+
+/// Function designation in front of an address, e.g. `Motor 1.2 ON` (regex from Python).
+fn function_regex() -> &'static regex::Regex {
+    static FUNCTION: OnceLock<regex::Regex> = OnceLock::new();
+    FUNCTION.get_or_init(|| regex::Regex::new(r"([A-Za-z][A-Za-z\s]+(?:\d+\.)+\d+(?:\s+[A-Z]+)?)").unwrap())
+}
+
+// Number of page source dumps written per run for pages without any diagram text
+const MAX_DEBUG_DUMPS: u32 = 3;
+
+// Debug output of the formatted entries of every extracted page, in JSON Lines format
+const EXTRACTED_PAGES_FILE: &str = "extracted_pages.jsonl";
+
+// Clicks the first element matched by the XPath list in arguments[0] and returns
+// that XPath, or null if none matched
+const CLICK_FIRST_XPATH_JS: &str = "for (const xpath of arguments[0]) { \
+    const el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue; \
+    if (el) { el.scrollIntoView(true); el.click(); return xpath; } \
+} return null;";
+
+// Describes every rendered page list item in one script call: its index, whether it
+// is a PLC diagram and a signature to recognise it again after scrolling (data-page-id, or
+// the full item text; hashed on our side). Only PLC items carry a signature and a label,
+// the label preferably being their description line (.ev-description.ev-hi).
+const PAGE_LIST_SCAN_JS: &str = "return Array.from(document.querySelectorAll('pv-page-list-item')).map((el, i) => { \
+    const text = el.innerText || ''; \
+    const plc = text.includes('PLC-Diagram'); \
+    const desc = plc ? el.querySelector('.ev-description.ev-hi') : null; \
+    return { index: i, plc: plc, \
+        sig: plc ? (el.dataset.pageId || text) : '', \
+        label: plc ? ((desc && desc.innerText) || text).replace(/\\s+/g, ' ').trim() : '' }; });";
+
+// Scrolls the container in arguments[0] down by 400px and returns the new scrollTop once the
+// virtual list has rendered (two animation frames, or 250ms if frames are paused, e.g. minimized)
+const SCROLL_STEP_JS: &str = "const el = arguments[0], done = arguments[arguments.length - 1]; \
+    let sent = false; \
+    const finish = () => { if (!sent) { sent = true; done(Math.round(el.scrollTop)); } }; \
+    el.scrollTop += 400; \
+    requestAnimationFrame(() => requestAnimationFrame(finish)); \
+    setTimeout(finish, 250);";
+
+// Number of PLC pages opened and read per script call
+const PAGE_BATCH_SIZE: usize = 20;
+
+// Opens the page list items at the indices in arguments[0] one after another and collects
+// the text of each diagram's leaf <text>/<tspan> nodes, all inside the browser. The diagram is
+// the largest SVG with text outside the page list and buttons, so toolbar icons are ignored.
+// After a click it waits (MutationObserver, at most 5s) until that diagram has been replaced
+// or its text has changed. Returns one entry per index: the texts, or null if the item no
+// longer exists. Stops after a page without text so the caller can look at that page as it
+// is displayed.
+const EXTRACT_PAGES_JS: &str = "const indices = arguments[0], done = arguments[arguments.length - 1]; \
+    const area = (el) => { const r = el.getBoundingClientRect(); return r.width * r.height; }; \
+    const diagram = () => Array.from(document.querySelectorAll('svg')) \
+        .filter(svg => !svg.closest('pv-page-list-item, button, eplan-icon-button') && svg.querySelector('text')) \
+        .reduce((best, svg) => (!best || area(svg) > area(best)) ? svg : best, null); \
+    const svgTexts = (svg) => !svg ? [] : Array.from(svg.querySelectorAll('text, tspan')) \
+        .filter(e => e.childElementCount === 0) \
+        .map(e => e.textContent.trim()).filter(Boolean); \
+    const newDiagram = (prev) => new Promise(resolve => { \
+        const prevText = prev ? prev.textContent : null; \
+        const ready = () => { const d = diagram(); return d !== null && (d !== prev || d.textContent !== prevText); }; \
+        if (ready()) { resolve(); return; } \
+        const observer = new MutationObserver(() => { if (ready()) { finish(); } }); \
+        const timer = setTimeout(() => finish(), 5000); \
+        const finish = () => { observer.disconnect(); clearTimeout(timer); resolve(); }; \
+        observer.observe(document.body, { childList: true, subtree: true, characterData: true }); \
+    }); \
+    (async () => { \
+        const pages = []; \
+        for (const index of indices) { \
+            const item = document.querySelectorAll('pv-page-list-item')[index]; \
+            if (!item) { pages.push(null); continue; } \
+            const prev = diagram(); \
+            item.click(); \
+            await newDiagram(prev); \
+            const texts = svgTexts(diagram()); \
+            pages.push(texts); \
+            if (texts.length === 0) { break; } \
+        } \
+        done(pages); \
+    })().catch(e => done({ error: String(e) }));";
+
+#[derive(Debug, Deserialize)]
+struct PageListItem {
+    index: usize,
+    plc: bool,
+    sig: String,
+    label: String,
+}
+
+impl PageListItem {
+    /// 8-byte key for the seen-pages set, so the set does not retain the signature strings.
+    fn sig_key(&self) -> u64 {
+        use std::hash::{Hash, Hasher};
+        let mut hasher = std::collections::hash_map::DefaultHasher::new();
+        self.sig.hash(&mut hasher);
+        hasher.finish()
+    }
+}
+
+/// Quotes `value` as an XPath string literal. XPath 1.0 has no escape sequences, so
+/// values containing both quote kinds are built with `concat()`.
+fn xpath_literal(value: &str) -> String {
+    if !value.contains('\'') {
+        format!("'{}'", value)
+    } else if !value.contains('"') {
+        format!("\"{}\"", value)
+    } else {
+        let parts: Vec<String> = value.split('\'').map(|part| format!("'{}'", part)).collect();
+        format!("concat({})", parts.join(", \"'\", "))
+    }
+}
+
+/// Various ways the project could be displayed (from Python), in order of preference.
+/// Built once per engine since the project number does not change.
+fn project_xpaths(project_number: &str) -> Vec<String> {
+    let literal = xpath_literal(project_number);
+    vec![
+        format!("//td[contains(text(), {})]", literal),
+        format!("//span[contains(text(), {})]", literal),
+        format!("//div[contains(text(), {})]", literal),
+        format!("//a[contains(text(), {})]", literal),
+        format!("//tr[contains(., {})]", literal),
+        format!("//*[text()={}]", literal),
+    ]
+}
+
 pub struct ScraperEngine {
     browser: browser::BrowserDriver,
     config: ScraperConfig,
     logger: Arc<Mutex<Box<dyn Logger>>>,
     chromedriver_manager: Arc<ChromeDriverManager>,
     extracted_table: Option<PlcTable>,
+    project_xpaths: Vec<String>,
+    // Page source dumps left for pages that yield no text; each dump can be megabytes
+    debug_dumps_remaining: u32,
 }
 
 #[derive(Debug, Clone)]
@@ -22,6 +202,7 @@ pub struct ScraperConfig {
     pub password: String,
     pub project_number: String,
     pub headless: bool,
+    pub debug: bool,
 }
 
 pub trait Logger: Send + Sync {
@@ -46,20 +227,21 @@ impl ScraperEngine {
         chromedriver_manager.start_driver(9516).await
             .map_err(|e| anyhow::anyhow!("Failed to start ChromeDriver: {}", e))?;
 
-        // Wait a bit for ChromeDriver to fully start
-        tokio::time::sleep(tokio::time::Duration::from_millis(2000)).await;
-
         println!("DEBUG: ScraperEngine::new() - About to create BrowserDriver");
         let browser = browser::BrowserDriver::new(config.headless).await?;
 
         println!("DEBUG: ScraperEngine::new() - BrowserDriver created successfully");
 
+        let project_xpaths = project_xpaths(&config.project_number);
+
         Ok(Self {
             browser,
             config,
             logger,
             chromedriver_manager,
             extracted_table: None,
+            project_xpaths,
+            debug_dumps_remaining: MAX_DEBUG_DUMPS,
         })
     }
 
@@ -80,24 +262,31 @@ impl ScraperEngine {
 
         // Step 2: Handle Microsoft login
         self.log("📍 Step 2/6: Handling Microsoft login...".to_string(), LogLevel::Info).await;
-        match self.click_microsoft_login().await {
-            Ok(_) => {
+        let login_required = match self.click_microsoft_login().await {
+            Ok(true) => {
                 self.log("✅ Microsoft login button clicked successfully".to_string(), LogLevel::Success).await;
+                true
+            }
+            Ok(false) => {
+                self.log("✅ Existing eVIEW session found, skipping login".to_string(), LogLevel::Success).await;
+                false
             }
             Err(e) => {
                 self.log(format!("❌ Failed to click Microsoft login: {}", e), LogLevel::Error).await;
                 return Err(anyhow::anyhow!("Microsoft login button click failed: {}", e));
             }
-        }
+        };
 
-        self.log("🔐 Performing Microsoft SSO login...".to_string(), LogLevel::Info).await;
-        match self.perform_login().await {
-            Ok(_) => {
-                self.log("✅ Microsoft SSO login completed successfully".to_string(), LogLevel::Success).await;
-            }
-            Err(e) => {
-                self.log(format!("❌ Microsoft login process failed: {}", e), LogLevel::Error).await;
-                return Err(anyhow::anyhow!("Microsoft login failed: {}", e));
+        if login_required {
+            self.log("🔐 Performing Microsoft SSO login...".to_string(), LogLevel::Info).await;
+            match self.perform_login().await {
+                Ok(_) => {
+                    self.log("✅ Microsoft SSO login completed successfully".to_string(), LogLevel::Success).await;
+                }
+                Err(e) => {
+                    self.log(format!("❌ Microsoft login process failed: {}", e), LogLevel::Error).await;
+                    return Err(anyhow::anyhow!("Microsoft login failed: {}", e));
+                }
             }
         }
 
@@ -153,127 +342,101 @@ impl ScraperEngine {
     }
 
     async fn log(&self, message: String, level: LogLevel) {
+        if matches!(level, LogLevel::Debug) && !self.config.debug {
+            return;
+        }
         let logger = self.logger.lock().await;
         logger.log(message, level);
     }
 
-    async fn click_microsoft_login(&mut self) -> Result<()> {
+    /// Clicks the Microsoft login button. Returns `false` without clicking when the
+    /// project list is already shown, i.e. the persisted browser profile is still signed in.
+    async fn click_microsoft_login(&mut self) -> Result<bool> {
         self.log("Looking for Microsoft login button".to_string(), LogLevel::Info).await;
 
-        // Try multiple times to find the Microsoft login button (Python: 15 attempts)
-        for attempt in 1..=15 {
-            self.log(format!("Looking for Microsoft button... [{}/15]", attempt), LogLevel::Info).await;
-
-            // Find all buttons first (debugging)
-            if let Ok(all_buttons) = self.browser.find_elements(thirtyfour::By::Tag("button")).await {
-                self.log(format!("Found buttons: {}", all_buttons.len()), LogLevel::Debug).await;
-
-                // Log first few buttons for debugging
-                for (i, btn) in all_buttons.iter().take(5).enumerate() {
-                    if let Ok(is_displayed) = btn.is_displayed().await {
-                        if is_displayed {
-                            let text = btn.text().await.unwrap_or_default();
-                            let value = btn.attr("value").await.unwrap_or(None).unwrap_or_default();
-                            let class = btn.attr("class").await.unwrap_or(None).unwrap_or_default();
-                            self.log(format!("Button {}: '{}' | Value: '{}' | Class: '{}'", i, text, value, class), LogLevel::Debug).await;
-                        }
-                    }
-                }
+        // Wait until an element mentioning 'Microsoft' is clickable (Python: 15 attempts),
+        // or the project itself if the session is still valid
+        let microsoft_xpath = "//button[contains(translate(., 'MICROSOFT', 'microsoft'), 'microsoft')] | //*[contains(translate(@title, 'MICROSOFT', 'microsoft'), 'microsoft')]";
+        let login_or_project_xpath = format!("{} | {}", microsoft_xpath, self.project_xpaths.join(" | "));
+        self.browser.wait_for_clickable(thirtyfour::By::XPath(login_or_project_xpath.as_str()), 15).await
+            .map_err(|_| anyhow::anyhow!("Could not find Microsoft login button within 15 seconds"))?;
+
+        // Only a displayed and enabled Microsoft element counts; otherwise what became
+        // clickable is the project row
+        let microsoft_button = match self.browser.find_clickable_now(thirtyfour::By::XPath(microsoft_xpath)).await? {
+            Some(button) => button,
+            None => return Ok(false),
+        };
+
+        microsoft_button.click().await?;
+
+        // Check if we navigated to Microsoft login. With a still valid Microsoft cookie the
+        // login page redirects straight back to eVIEW, possibly faster than we poll the URL;
+        // the clicked button going stale tells that the page did navigate.
+        let timeout = std::time::Duration::from_secs(15);
+        let start = std::time::Instant::now();
+        loop {
+            let current_url = self.browser.get_current_url().await?;
+            if current_url.contains("login.microsoft") {
+                break;
             }
 
-            // Find all elements containing 'Microsoft' text
-            let microsoft_selectors = vec![
-                "//*[contains(text(), 'Microsoft') or contains(text(), 'microsoft') or contains(@title, 'Microsoft')]"
-            ];
-
-            for selector in microsoft_selectors {
-                if let Ok(elements) = self.browser.find_elements(thirtyfour::By::XPath(selector)).await {
-                    for elem in elements {
-                        match (elem.is_displayed().await, elem.is_enabled().await) {
-                            (Ok(true), Ok(true)) => {
-                                if let Ok(()) = elem.click().await {
-                                    tokio::time::sleep(tokio::time::Duration::from_secs(1)).await;
-
-                                    // Check if we navigated to Microsoft login
-                                    if let Ok(url) = self.browser.get_current_url().await {
-                                        if url.contains("login.microsoft") {
-                                            self.log("Successfully clicked Microsoft login button".to_string(), LogLevel::Success).await;
-                                            return Ok(());
-                                        }
-                                    }
-                                }
-                            }
-                            _ => continue,
-                        }
-                    }
-                }
+            if !microsoft_button.is_present().await.unwrap_or(true) && self.is_eview_url(&current_url) {
+                self.log("Signed in via cached Microsoft session".to_string(), LogLevel::Info).await;
+                return Ok(false);
+            }
+
+            if start.elapsed() > timeout {
+                return Err(anyhow::anyhow!("Microsoft login page did not open after clicking the button"));
             }
 
-            tokio::time::sleep(tokio::time::Duration::from_secs(1)).await;
+            tokio::time::sleep(tokio::time::Duration::from_millis(250)).await;
         }
 
-        Err(anyhow::anyhow!("Could not find Microsoft login button after 15 attempts"))
+        self.log("Successfully clicked Microsoft login button".to_string(), LogLevel::Success).await;
+        Ok(true)
     }
 
-    async fn perform_login(&mut self) -> Result<()> {
-        self.log("Waiting for Microsoft email field...".to_string(), LogLevel::Info).await;
+    /// Whether `url` is an eVIEW page rather than part of the Microsoft login.
+    fn is_eview_url(&self, url: &str) -> bool {
+        let url_lower = url.to_lowercase();
+        !url_lower.contains("login") && (url.contains(&self.config.base_url) || url_lower.contains("eview"))
+    }
 
-        // Email field selectors from Python
-        let email_selectors = vec![
-            "input[type='email']",
-            "input[name='loginfmt']",
-            "input[id='i0116']",
-            "input[id='email']",
-            "input[placeholder*='Email']",
-            "input[placeholder*='E-Mail']",
-            "input[name='username']",
-        ];
+    async fn perform_login(&mut self) -> Result<()> {
+        // With a persisted profile Microsoft may complete SSO on its own
+        if !self.browser.get_current_url().await?.to_lowercase().contains("login") {
+            self.log("Already signed in via cached Microsoft session".to_string(), LogLevel::Info).await;
+            return Ok(());
+        }
 
-        // Find email field with retry logic
-        let mut email_field = None;
-        for attempt in 1..=15 {
-            self.log(format!("Waiting for email field... [{}/15]", attempt), LogLevel::Debug).await;
+        self.log("Waiting for Microsoft email field...".to_string(), LogLevel::Info).await;
 
-            for selector in &email_selectors {
-                if let Ok(field) = self.browser.find_element(thirtyfour::By::Css(*selector)).await {
-                    if field.is_displayed().await.unwrap_or(false) {
-                        self.log(format!("Email field found with selector: {}", selector), LogLevel::Debug).await;
-                        email_field = Some(field);
-                        break;
-                    }
+        let email_field = match self.browser.wait_for_clickable(thirtyfour::By::Css(EMAIL_CSS), 15).await {
+            Ok(field) => field,
+            Err(_) => {
+                // The cached Microsoft session may have redirected back while we waited
+                if self.is_eview_url(&self.browser.get_current_url().await?) {
+                    self.log("Already signed in via cached Microsoft session".to_string(), LogLevel::Info).await;
+                    return Ok(());
                 }
+                return Err(anyhow::anyhow!("Email field not found"));
             }
-            if email_field.is_some() { break; }
-            tokio::time::sleep(tokio::time::Duration::from_secs(1)).await;
-        }
-
-        let email_field = email_field.ok_or_else(|| anyhow::anyhow!("Email field not found"))?;
+        };
 
         // Enter email
         self.log("Type in email...".to_string(), LogLevel::Info).await;
-        email_field.clear().await.map_err(|_| anyhow::anyhow!("Unable to clear email field"))?;
-        email_field.send_keys(&self.config.username).await.map_err(|_| anyhow::anyhow!("Unable to type in email"))?;
+        self.browser.set_input_value(&email_field, &self.config.username).await.map_err(|_| anyhow::anyhow!("Unable to type in email"))?;
 
         // Click Next button
         self.log("Looking for 'Next' button...".to_string(), LogLevel::Info).await;
-        let next_button_selectors = vec![
-            "input[type='submit']",
-            "input[id='idSIButton9']",
-            "button[type='submit']",
-            "input[value='Next']",
-            "input[value='Weiter']",
-            "button[id='idSIButton9']",
-        ];
-
         let mut next_clicked = false;
-        for selector in &next_button_selectors {
-            if let Ok(next_button) = self.browser.find_element(thirtyfour::By::Css(*selector)).await {
-                if next_button.is_displayed().await.unwrap_or(false) && next_button.is_enabled().await.unwrap_or(false) {
-                    next_button.click().await?;
-                    self.log(format!("'Next' button clicked with selector: {}", selector), LogLevel::Debug).await;
-                    next_clicked = true;
-                    break;
-                }
+        for next_button in self.browser.find_elements(thirtyfour::By::Css(NEXT_BUTTON_CSS)).await.unwrap_or_default() {
+            if next_button.is_displayed().await.unwrap_or(false) && next_button.is_enabled().await.unwrap_or(false) {
+                next_button.click().await?;
+                self.log("'Next' button clicked".to_string(), LogLevel::Debug).await;
+                next_clicked = true;
+                break;
             }
         }
 
@@ -283,61 +446,23 @@ impl ScraperEngine {
             self.log("Submit-button pressed instead of Next-button".to_string(), LogLevel::Debug).await;
         }
 
-        // Wait for password page
-        tokio::time::sleep(tokio::time::Duration::from_secs(3)).await;
-
-        // Password field logic
+        // Password field logic (the explicit wait covers the page transition)
         self.log("Looking for password field...".to_string(), LogLevel::Info).await;
-        let password_selectors = vec![
-            "input[type='password']",
-            "input[name='passwd']",
-            "input[id='i0118']",
-            "input[id='passwordInput']",
-            "input[placeholder*='Password']",
-            "input[placeholder*='Passwort']",
-        ];
-
-        let mut password_field = None;
-        for attempt in 1..=15 {
-            for selector in &password_selectors {
-                if let Ok(field) = self.browser.find_element(thirtyfour::By::Css(*selector)).await {
-                    if field.is_displayed().await.unwrap_or(false) {
-                        self.log(format!("Password field found with selector: {}", selector), LogLevel::Debug).await;
-                        password_field = Some(field);
-                        break;
-                    }
-                }
-            }
-            if password_field.is_some() { break; }
-            tokio::time::sleep(tokio::time::Duration::from_secs(1)).await;
-            self.log(format!("Waiting for password field... [{}/15]", attempt), LogLevel::Debug).await;
-        }
+        let password_field = self.browser.wait_for_clickable(thirtyfour::By::Css(PASSWORD_CSS), 15).await.ok();
 
         if let Some(password_field) = password_field {
             self.log("Inserting password...".to_string(), LogLevel::Info).await;
-            password_field.clear().await?;
-            password_field.send_keys(&self.config.password).await?;
+            self.browser.set_input_value(&password_field, &self.config.password).await?;
 
             // Click Sign-In button
             self.log("Looking for 'Sign-In' button".to_string(), LogLevel::Info).await;
-            let signin_button_selectors = vec![
-                "input[type='submit']",
-                "input[id='idSIButton9']",
-                "button[type='submit']",
-                "input[value='Sign in']",
-                "input[value='Anmelden']",
-                "button[id='idSIButton9']",
-            ];
-
             let mut signin_clicked = false;
-            for selector in &signin_button_selectors {
-                if let Ok(signin_button) = self.browser.find_element(thirtyfour::By::Css(*selector)).await {
-                    if signin_button.is_displayed().await.unwrap_or(false) && signin_button.is_enabled().await.unwrap_or(false) {
-                        signin_button.click().await?;
-                        self.log(format!("'Sign-In' button clicked with selector: {}", selector), LogLevel::Debug).await;
-                        signin_clicked = true;
-                        break;
-                    }
+            for signin_button in self.browser.find_elements(thirtyfour::By::Css(SIGNIN_BUTTON_CSS)).await.unwrap_or_default() {
+                if signin_button.is_displayed().await.unwrap_or(false) && signin_button.is_enabled().await.unwrap_or(false) {
+                    signin_button.click().await?;
+                    self.log("'Sign-In' button clicked".to_string(), LogLevel::Debug).await;
+                    signin_clicked = true;
+                    break;
                 }
             }
 
@@ -350,41 +475,24 @@ impl ScraperEngine {
         }
 
         // Handle "Stay signed in?" dialog
-        for attempt in 1..=15 {
-            self.log(format!("Trying to click on 'Yes' button... [{}/15]", attempt), LogLevel::Debug).await;
-
-            let stay_signed_selectors = vec![
-                "input[id='idSIButton9']",
-                "input[value='Yes']",
-                "input[value='Ja']",
-                "button[id='idSIButton9']",
-            ];
-
-            let mut clicked = false;
-            for selector in &stay_signed_selectors {
-                if let Ok(button) = self.browser.find_element(thirtyfour::By::Css(*selector)).await {
-                    if button.is_displayed().await.unwrap_or(false) && button.is_enabled().await.unwrap_or(false) {
-                        button.click().await?;
-                        self.log("'Stay logged in' dialogue answered with 'Yes'".to_string(), LogLevel::Debug).await;
-                        clicked = true;
-                        break;
-                    }
-                }
-            }
-            if clicked { break; }
-            tokio::time::sleep(tokio::time::Duration::from_secs(1)).await;
+        self.log("Waiting for 'Stay signed in' dialogue...".to_string(), LogLevel::Debug).await;
+        if let Ok(button) = self.browser.wait_for_clickable(thirtyfour::By::Css(STAY_SIGNED_IN_CSS), 15).await {
+            button.click().await?;
+            self.log("'Stay logged in' dialogue answered with 'Yes'".to_string(), LogLevel::Debug).await;
         }
 
         // Handle organization selection if multi-org dialog appears
         self.handle_organization_selection().await?;
 
         self.log("Waiting for return to EPLAN eVIEW...".to_string(), LogLevel::Info).await;
-        tokio::time::sleep(tokio::time::Duration::from_secs(5)).await;
+        // The wait already returns the URL it saw, so only read it again on timeout
+        let current_url = match self.browser.wait_for_url(|url| !url.to_lowercase().contains("login"), 15).await {
+            Ok(url) => url,
+            Err(_) => self.browser.get_current_url().await?,
+        };
 
         // Check if login was successful
-        let current_url = self.browser.get_current_url().await?;
-        if !current_url.to_lowercase().contains("login") &&
-           (current_url.contains(&self.config.base_url) || current_url.to_lowercase().contains("eview")) {
+        if self.is_eview_url(&current_url) {
             self.log("Microsoft SSO login successful!".to_string(), LogLevel::Success).await;
             Ok(())
         } else {
@@ -397,8 +505,8 @@ impl ScraperEngine {
         self.log("Checking for organization selection dialog...".to_string(), LogLevel::Debug).await;
 
         // Check if we're on an organization selection page
-        let current_url = self.browser.get_current_url().await?;
-        if !current_url.to_lowercase().contains("organization") && !current_url.to_lowercase().contains("tenant") {
+        let url_lower = self.browser.get_current_url().await?.to_lowercase();
+        if !url_lower.contains("organization") && !url_lower.contains("tenant") {
             self.log("No organization selection dialog detected".to_string(), LogLevel::Debug).await;
             return Ok(());
         }
@@ -450,9 +558,6 @@ impl ScraperEngine {
 
         if organization_selected {
             self.log("Organization selection completed successfully".to_string(), LogLevel::Success).await;
-
-            // Give it a moment to process
-            tokio::time::sleep(tokio::time::Duration::from_secs(2)).await;
         } else {
             self.log("No 3CON organization found, proceeding anyway...".to_string(), LogLevel::Warning).await;
         }
@@ -465,122 +570,75 @@ impl ScraperEngine {
 
         // Wait for project overview
         self.log("Waiting for project overview...".to_string(), LogLevel::Info).await;
-        tokio::time::sleep(tokio::time::Duration::from_secs(3)).await;
-
-        self.log(format!("Looking for project '{}' in the list...", self.config.project_number), LogLevel::Info).await;
-
-        // Various ways the project could be displayed (from Python)
-        let project_selectors = vec![
-            format!("//td[contains(text(), '{}')]", self.config.project_number),
-            format!("//span[contains(text(), '{}')]", self.config.project_number),
-            format!("//div[contains(text(), '{}')]", self.config.project_number),
-            format!("//a[contains(text(), '{}')]", self.config.project_number),
-            format!("//tr[contains(., '{}')]", self.config.project_number),
-            format!("//*[text()='{}']", self.config.project_number),
-        ];
-
-        let mut project_element = None;
-
-        for xpath in &project_selectors {
-            match self.browser.find_elements(thirtyfour::By::XPath(xpath)).await {
-                Ok(elements) if !elements.is_empty() => {
-                    project_element = Some(elements[0].clone());
-                    self.log(format!("Project found with XPath: {}", xpath), LogLevel::Success).await;
-                    break;
-                }
-                _ => {
-                    // Try single element fallback
-                    if let Ok(element) = self.browser.find_element(thirtyfour::By::XPath(xpath)).await {
-                        project_element = Some(element);
-                        self.log(format!("Project-element found with XPath: {}", xpath), LogLevel::Success).await;
-                        break;
-                    }
-                }
-            }
-        }
-
-        if project_element.is_none() {
-            // List all table rows for debugging (first 10)
-            if let Ok(all_rows) = self.browser.find_elements(thirtyfour::By::Tag("tr")).await {
-                self.log(format!("Found table rows: {}", all_rows.len()), LogLevel::Debug).await;
-                for (i, row) in all_rows.iter().take(10).enumerate() {
-                    if let Ok(row_text) = row.text().await {
-                        let truncated_text = if row_text.len() > 100 {
-                            format!("{}...", &row_text[..100])
-                        } else {
-                            row_text
-                        };
-                        self.log(format!("Row {}: {}", i, truncated_text), LogLevel::Debug).await;
-                    }
-                }
-            }
-            return Err(anyhow::anyhow!("Project '{}' not found in list", self.config.project_number));
+        let project_xpath = self.project_xpaths.join(" | ");
+        if self.browser.wait_for_clickable(thirtyfour::By::XPath(project_xpath.as_str()), 15).await.is_err() {
+            self.log("Project overview did not show the project in time".to_string(), LogLevel::Debug).await;
         }
 
-        let project_element = project_element.unwrap();
+        self.log(format!("Looking for project '{}' in the list...", self.config.project_number), LogLevel::Info).await;
 
-        // Select project (click on it) - make sure we click exactly on the project
         self.log("Choosing project...".to_string(), LogLevel::Info).await;
 
-        // Try to scroll to project element if still valid
-        if let Err(_) = self.browser.execute_script("arguments[0].scrollIntoView(true);", vec![project_element.clone()]).await {
-            self.log("Couldn't scroll to element, continuing".to_string(), LogLevel::Debug).await;
-        }
+        // Find, scroll to and click the project in one script call so the element
+        // cannot go stale between lookup and click
+        let clicked_xpath = self.browser.execute_script_with_args(CLICK_FIRST_XPATH_JS, vec![serde_json::json!(self.project_xpaths)]).await?;
 
-        // Click on the project element
-        match project_element.click().await {
-            Ok(_) => {
+        match clicked_xpath.as_str() {
+            Some(xpath) => {
+                self.log(format!("Project found with XPath: {}", xpath), LogLevel::Success).await;
                 self.log("Project clicked".to_string(), LogLevel::Debug).await;
             }
-            Err(_) => {
-                self.log("Direct click failed, trying alternative".to_string(), LogLevel::Debug).await;
-                // Try to find the parent row and click on it instead
-                if let Ok(parent_row) = project_element.find(thirtyfour::By::XPath("./ancestor-or-self::tr")).await {
-                    parent_row.click().await.map_err(|_| anyhow::anyhow!("Could not click on project row"))?;
-                    self.log("Clicked on parent row instead".to_string(), LogLevel::Debug).await;
+            None => {
+                // List all table rows for debugging (first 10), one round-trip per row
+                if self.config.debug {
+                    if let Ok(all_rows) = self.browser.find_elements(thirtyfour::By::Tag("tr")).await {
+                        self.log(format!("Found table rows: {}", all_rows.len()), LogLevel::Debug).await;
+                        for (i, row) in all_rows.iter().take(10).enumerate() {
+                            if let Ok(row_text) = row.text().await {
+                                let truncated_text = if row_text.len() > 100 {
+                                    format!("{}...", &row_text[..100])
+                                } else {
+                                    row_text
+                                };
+                                self.log(format!("Row {}: {}", i, truncated_text), LogLevel::Debug).await;
+                            }
+                        }
+                    }
                 }
+                return Err(anyhow::anyhow!("Project '{}' not found in list", self.config.project_number));
             }
         }
 
         // Look for 'Open' button
         self.log("Looking for 'Open' button...".to_string(), LogLevel::Info).await;
-        let all_buttons = self.browser.find_elements(thirtyfour::By::Tag("button")).await?;
+        let all_buttons = self.collect_button_info().await?;
         self.log(format!("Found buttons after project click: {}", all_buttons.len()), LogLevel::Debug).await;
 
         let mut open_button = None;
 
         for (idx, btn) in all_buttons.iter().enumerate() {
-            if let (Ok(btn_text), Ok(btn_value)) = (btn.text().await, btn.attr("value").await) {
-                let text = btn_text.trim();
-                let value = btn_value.unwrap_or_default();
-
-                if !text.is_empty() || !value.is_empty() {
-                    self.log(format!("Button {}: Text='{}' | Value='{}'", idx, text, value), LogLevel::Debug).await;
-                }
+            if !btn.text.is_empty() || !btn.value.is_empty() {
+                self.log(format!("Button {}: Text='{}' | Value='{}'", idx, btn.text, btn.value), LogLevel::Debug).await;
+            }
 
-                if text.to_lowercase().contains("öffnen") || text.to_lowercase().contains("open") {
-                    if btn.is_displayed().await.unwrap_or(false) && btn.is_enabled().await.unwrap_or(false) {
-                        open_button = Some(btn.clone());
-                        self.log(format!("'Open' button found: '{}'", text), LogLevel::Success).await;
-                        break;
-                    }
+            if open_button_regex().is_match(&btn.text) {
+                if btn.visible && btn.enabled {
+                    open_button = Some(idx);
+                    self.log(format!("'Open' button found: '{}'", btn.text), LogLevel::Success).await;
+                    break;
                 }
             }
         }
 
         if let Some(open_button) = open_button {
             self.log("Clicking on 'Open' button...".to_string(), LogLevel::Info).await;
-            open_button.click().await.map_err(|_| anyhow::anyhow!("Unable to click on 'Open' button"))?;
+            self.browser.execute_script_with_args("document.querySelectorAll('button')[arguments[0]].click();", vec![serde_json::json!(open_button)]).await
+                .map_err(|_| anyhow::anyhow!("Unable to click on 'Open' button"))?;
             self.log("'Open' button clicked".to_string(), LogLevel::Success).await;
 
-            self.log("Waiting for fully loading the project...".to_string(), LogLevel::Info).await;
-            tokio::time::sleep(tokio::time::Duration::from_secs(5)).await;
-
             // Wait for sidebar using WebDriverWait equivalent
-            // For now, just check if sidebar exists
-            tokio::time::sleep(tokio::time::Duration::from_secs(2)).await;
-
-            if let Ok(_sidebar) = self.browser.find_element(thirtyfour::By::XPath("//div[contains(@class, 'tree') or contains(@class, 'sidebar')]")).await {
+            self.log("Waiting for fully loading the project...".to_string(), LogLevel::Info).await;
+            if let Ok(_sidebar) = self.browser.wait_for_element(thirtyfour::By::XPath("//div[contains(@class, 'tree') or contains(@class, 'sidebar')]"), 15).await {
                 self.log("Project sidebar found".to_string(), LogLevel::Success).await;
             } else {
                 self.log("Project sidebar not found, still continuing".to_string(), LogLevel::Warning).await;
@@ -588,12 +646,12 @@ impl ScraperEngine {
 
             // Check if project was successfully opened
             let current_url = self.browser.get_current_url().await?;
+            let url_lower = current_url.to_lowercase();
             if current_url.contains(&self.config.project_number) ||
-               current_url.to_lowercase().contains("project") ||
-               current_url.to_lowercase().contains("viewer") ||
-               current_url.to_lowercase().contains("view") {
+               url_lower.contains("project") ||
+               url_lower.contains("viewer") ||
+               url_lower.contains("view") {
                 self.log(format!("Project '{}' successfully opened!", self.config.project_number), LogLevel::Success).await;
-                tokio::time::sleep(tokio::time::Duration::from_secs(2)).await;
                 Ok(())
             } else if current_url != self.config.base_url {
                 self.log("Navigated to new page, project probably opened".to_string(), LogLevel::Success).await;
@@ -607,86 +665,45 @@ impl ScraperEngine {
         }
     }
 
-    async fn switch_to_list_view(&mut self) -> Result<()> {
-        tokio::time::sleep(tokio::time::Duration::from_secs(1)).await;
-
-        // Click on button with three dots
-        self.log("Looking for buttons that are 'eplan-icon-button'".to_string(), LogLevel::Info).await;
-
-        let buttons = self.browser.find_elements(thirtyfour::By::Tag("eplan-icon-button")).await?;
-        self.log(format!("Found {} eplan-icon-button elements", buttons.len()), LogLevel::Info).await;
-
-        for (i, btn) in buttons.iter().enumerate() {
-            if !btn.is_displayed().await.unwrap_or(false) {
-                continue;
-            }
+    async fn collect_button_info(&self) -> Result<Vec<ButtonInfo>> {
+        let value = self.browser.execute_script_and_get_value(BUTTON_INFO_JS, vec![]).await?;
+        Ok(serde_json::from_value(value)?)
+    }
 
-            // Check for the specific data-t attribute
-            if let Ok(data_t) = btn.attr("data-t").await {
-                if let Some(data_t_value) = data_t {
-                    if !data_t_value.contains("ev-btn-page-more") {
-                        continue;
-                    }
+    async fn scan_page_list(&self) -> Result<Vec<PageListItem>> {
+        let value = self.browser.execute_script_and_get_value(PAGE_LIST_SCAN_JS, vec![]).await?;
+        Ok(serde_json::from_value(value)?)
+    }
 
-                    // Check if popup is already open
-                    if let Ok(class_attr) = btn.attr("class").await {
-                        if let Some(class_value) = class_attr {
-                            if class_value.contains("fl-pop-up-open") {
-                                self.log("Three dots pop-up is already open".to_string(), LogLevel::Info).await;
-                                break;
-                            }
-                        }
-                    }
+    async fn switch_to_list_view(&mut self) -> Result<()> {
+        // Click on button with three dots; the selectors do the filtering the old
+        // per-button attribute checks did, in one lookup each
+        self.log("Looking for the three dots button".to_string(), LogLevel::Info).await;
 
-                    // Try to click the button
-                    match btn.click().await {
-                        Ok(_) => {
-                            self.log("Clicked button with three dots.".to_string(), LogLevel::Info).await;
-                            break;
-                        }
-                        Err(_) => {
-                            return Err(anyhow::anyhow!("Can't click on button with three dots"));
-                        }
-                    }
-                } else {
-                    self.log(format!("Can't find button with three dots, called at index {}", i), LogLevel::Error).await;
-                    continue;
+        let popup_open = self.browser.find_elements(thirtyfour::By::Css(THREE_DOTS_OPEN_CSS)).await?;
+        if !popup_open.is_empty() {
+            self.log("Three dots pop-up is already open".to_string(), LogLevel::Info).await;
+        } else {
+            // Waiting for the toolbar button replaces the former fixed delay
+            match self.browser.wait_for_clickable(thirtyfour::By::Css(THREE_DOTS_CSS), 15).await {
+                Ok(btn) => {
+                    btn.click().await
+                        .map_err(|_| anyhow::anyhow!("Can't click on button with three dots"))?;
+                    self.log("Clicked button with three dots.".to_string(), LogLevel::Info).await;
                 }
-            } else {
-                self.log(format!("No data-t attribute found for button {}", i), LogLevel::Debug).await;
-                continue;
-            }
-        }
-
-        // Now find the list view button in the dropdown
-        let dropdown_buttons = self.browser.find_elements(thirtyfour::By::Tag("eplan-dropdown-item")).await?;
-
-        for btn in dropdown_buttons {
-            if !btn.is_displayed().await.unwrap_or(false) {
-                continue;
-            }
-
-            // Check for the specific data-name attribute
-            if let Ok(data_name) = btn.attr("data-name").await {
-                if let Some(data_name_value) = data_name {
-                    if !data_name_value.contains("ev-page-list-view-btn") {
-                        continue;
-                    }
-
-                    match btn.click().await {
-                        Ok(_) => {
-                            self.log("Clicked 'List' Button".to_string(), LogLevel::Info).await;
-                            return Ok(());
-                        }
-                        Err(_) => {
-                            return Err(anyhow::anyhow!("Can't click on 'List' button"));
-                        }
-                    }
+                Err(_) => {
+                    self.log("Can't find button with three dots".to_string(), LogLevel::Error).await;
                 }
             }
         }
 
-        Err(anyhow::anyhow!("Failed to switch to list view"))
+        // Now find the list view button in the dropdown
+        let list_button = self.browser.wait_for_clickable(thirtyfour::By::Css(LIST_VIEW_ITEM_CSS), 5).await
+            .map_err(|_| anyhow::anyhow!("Failed to switch to list view"))?;
+        list_button.click().await
+            .map_err(|_| anyhow::anyhow!("Can't click on 'List' button"))?;
+        self.log("Clicked 'List' Button".to_string(), LogLevel::Info).await;
+        Ok(())
     }
 
     async fn extract_tables(&mut self) -> Result<bool> {
@@ -724,9 +741,20 @@ impl ScraperEngine {
         self.log("📍 STEP 2: Starting systematic page-by-page processing...".to_string(), LogLevel::Info).await;
 
         let mut last_height = -1i64;
-        let mut plc_diagram_pages = std::collections::HashSet::new();
-        let mut extracted_page_texts = Vec::new();
+        let mut plc_diagram_pages: std::collections::HashSet<u64> = std::collections::HashSet::new();
+        let mut pages_attempted = 0;
+        let mut pages_with_content = 0;
         let mut total_pages_processed = 0;
+
+        // Extracted pages are written for debugging as they come in (one JSON string per
+        // line), so nothing is re-serialized and partial results survive an aborted run
+        let mut pages_file = match std::fs::File::create(EXTRACTED_PAGES_FILE) {
+            Ok(file) => Some(std::io::BufWriter::new(file)),
+            Err(e) => {
+                self.log(format!("⚠️ Could not create {}: {}", EXTRACTED_PAGES_FILE, e), LogLevel::Warning).await;
+                None
+            }
+        };
         let mut scroll_iteration = 0;
 
         // Main scrolling loop
@@ -734,8 +762,8 @@ impl ScraperEngine {
             scroll_iteration += 1;
             self.log(format!("🔄 SCROLL ITERATION #{}: Scanning for page items...", scroll_iteration), LogLevel::Info).await;
 
-            // Find visible items
-            let visible_items = match self.browser.find_elements(thirtyfour::By::Tag("pv-page-list-item")).await {
+            // Describe all visible items in a single round-trip
+            let visible_items = match self.scan_page_list().await {
                 Ok(items) => {
                     self.log(format!("📋 Found {} visible page items in iteration #{}", items.len(), scroll_iteration), LogLevel::Debug).await;
                     items
@@ -746,140 +774,96 @@ impl ScraperEngine {
                 }
             };
 
-            // Process each visible item systematically
-            for i in 0..visible_items.len() {
+            // Pick the PLC pages not seen yet. Pages only count as seen once their texts
+            // came back, so a failed batch is retried if its items are still visible later.
+            let mut pending = Vec::new();
+            let mut pending_keys = std::collections::HashSet::new();
+            for item in visible_items {
                 total_pages_processed += 1;
 
-                // Re-fetch element to avoid stale references
-                if let Ok(current_items) = self.browser.find_elements(thirtyfour::By::Tag("pv-page-list-item")).await {
-                    if i >= current_items.len() {
-                        self.log(format!("⚠️ Item index {} out of bounds ({}), skipping", i, current_items.len()), LogLevel::Warning).await;
-                        continue;
-                    }
+                if !item.plc {
+                    self.log(format!("⚪ Page item #{} is not a PLC-Diagram (skipped)", total_pages_processed), LogLevel::Debug).await;
+                    continue;
+                }
 
-                    let item = &current_items[i];
-                    self.log(format!("🔍 Processing page item #{} (iteration #{}, item #{})", total_pages_processed, scroll_iteration, i+1), LogLevel::Debug).await;
-
-                    // Check for PLC-Diagram using the correct selectors from screenshots
-                    let mut is_plc_diagram = false;
-                    let mut found_text = String::new();
-
-                    // Method 1: Look for .ev-description.ev-hi elements (from screenshot analysis)
-                    if let Ok(description_elements) = item.find_all(thirtyfour::By::Css(".ev-description.ev-hi")).await {
-                        self.log(format!("🔍 Found {} .ev-description.ev-hi elements", description_elements.len()), LogLevel::Debug).await;
-
-                        for desc_element in &description_elements {
-                            if let Ok(text) = desc_element.text().await {
-                                self.log(format!("📝 .ev-description.ev-hi text: '{}'", text), LogLevel::Debug).await;
-                                if text.contains("PLC-Diagram") {
-                                    is_plc_diagram = true;
-                                    found_text = text.clone();
-                                    self.log(format!("✅ FOUND PLC-Diagram in .ev-description.ev-hi: '{}'", text), LogLevel::Success).await;
-                                    break;
-                                }
-                            }
-                        }
-                    }
+                if plc_diagram_pages.contains(&item.sig_key()) || !pending_keys.insert(item.sig_key()) {
+                    self.log(format!("⚠️ PLC page already processed (duplicate): '{}'", item.label), LogLevel::Debug).await;
+                    continue;
+                }
 
-                    // Method 2: Fallback - look in all nested elements
-                    if !is_plc_diagram {
-                        if let Ok(all_nested) = item.find_all(thirtyfour::By::XPath(".//*[contains(text(), 'PLC-Diagram')]")).await {
-                            if !all_nested.is_empty() {
-                                if let Ok(text) = all_nested[0].text().await {
-                                    is_plc_diagram = true;
-                                    found_text = text.clone();
-                                    self.log(format!("✅ FOUND PLC-Diagram via XPath fallback: '{}'", text), LogLevel::Success).await;
-                                }
-                            }
-                        }
-                    }
+                pending.push(item);
+            }
 
-                    // Method 3: Ultimate fallback - check all text content
-                    if !is_plc_diagram {
-                        if let Ok(item_text) = item.text().await {
-                            self.log(format!("📝 Full item text: '{}'", item_text.replace("\n", " ").trim()), LogLevel::Debug).await;
-                            if item_text.contains("PLC-Diagram") {
-                                is_plc_diagram = true;
-                                found_text = item_text.clone();
-                                self.log(format!("✅ FOUND PLC-Diagram in full text: '{}'", item_text.replace("\n", " ").trim()), LogLevel::Success).await;
-                            }
-                        }
+            // Open and read the new PLC pages in batches, one script call per batch
+            let mut next = 0;
+            while next < pending.len() {
+                let end = (next + PAGE_BATCH_SIZE).min(pending.len());
+                let indices: Vec<usize> = pending[next..end].iter().map(|item| item.index).collect();
+                self.log(format!("⚙️ Extracting {} PLC pages in one batch...", indices.len()), LogLevel::Info).await;
+
+                let pages = match self.extract_page_batch(&indices).await {
+                    Ok(pages) if !pages.is_empty() => pages,
+                    Ok(_) => break,
+                    Err(e) => {
+                        self.log(format!("❌ Error extracting PLC page batch: {}", e), LogLevel::Error).await;
+                        next = end;
+                        continue;
                     }
-
-                    if is_plc_diagram {
-                        // Get unique identifier using outerHTML
-                        if let Ok(Some(outer_html)) = item.attr("outerHTML").await {
-                            if plc_diagram_pages.insert(outer_html) {
-                                self.log(format!("🎯 CLICKING PLC-Diagram page #{} (found text: '{}')", plc_diagram_pages.len(), found_text.replace("\n", " ").trim()), LogLevel::Info).await;
-
-                                // Small delay to stabilize
-                                tokio::time::sleep(tokio::time::Duration::from_millis(500)).await;
-
-                                // Click the item
-                                match item.click().await {
-                                    Ok(_) => {
-                                        self.log(format!("✅ Successfully clicked PLC page #{}", plc_diagram_pages.len()), LogLevel::Success).await;
-
-                                        // Wait for page to update
-                                        tokio::time::sleep(tokio::time::Duration::from_millis(500)).await;
-
-                                        // Extract content from this page
-                                        self.log(format!("⚙️ Extracting content from PLC page #{}...", plc_diagram_pages.len()), LogLevel::Info).await;
-                                        match self.extract_current_plc_diagram_page().await {
-                                            Ok(extracted_text) => {
-                                                if !extracted_text.is_empty() {
-                                                    extracted_page_texts.push(extracted_text);
-                                                    self.log(format!("✅ Successfully extracted content from PLC page #{} (total: {})", plc_diagram_pages.len(), extracted_page_texts.len()), LogLevel::Success).await;
-                                                } else {
-                                                    self.log(format!("⚠️ No content extracted from PLC page #{}", plc_diagram_pages.len()), LogLevel::Warning).await;
-                                                }
-                                            }
-                                            Err(e) => {
-                                                self.log(format!("❌ Error extracting content from PLC page #{}: {}", plc_diagram_pages.len(), e), LogLevel::Error).await;
-                                            }
-                                        }
-                                    }
-                                    Err(e) => {
-                                        self.log(format!("❌ Failed to click PLC page #{}: {}", plc_diagram_pages.len(), e), LogLevel::Error).await;
-                                    }
-                                }
-                            } else {
-                                self.log(format!("⚠️ PLC page already processed (duplicate): '{}'", found_text.replace("\n", " ").trim()), LogLevel::Debug).await;
+                };
+                let batch_start = next;
+                next += pages.len();
+
+                for (item, texts) in pending[batch_start..].iter().zip(pages) {
+                    pages_attempted += 1;
+
+                    let texts = match texts {
+                        Some(texts) => texts,
+                        None => {
+                            self.log(format!("⚠️ Item index {} no longer present, skipping", item.index), LogLevel::Warning).await;
+                            continue;
+                        }
+                    };
+                    plc_diagram_pages.insert(item.sig_key());
+
+                    self.log(format!("⚙️ Extracting content from PLC page #{} ('{}')...", pages_attempted, item.label), LogLevel::Info).await;
+                    let entries = self.entries_from_svg_texts(texts).await;
+                    if !entries.is_empty() {
+                        pages_with_content += 1;
+                        if let Some(writer) = pages_file.as_mut() {
+                            if let Err(e) = Self::append_extracted_page(writer, &Self::format_page_entries(&entries)) {
+                                self.log(format!("⚠️ Failed to write {}: {}", EXTRACTED_PAGES_FILE, e), LogLevel::Warning).await;
+                                pages_file = None;
                             }
                         }
+                        table.entries.extend(entries);
+                        self.log(format!("✅ Successfully extracted content from PLC page #{} (total: {})", pages_attempted, pages_with_content), LogLevel::Success).await;
                     } else {
-                        self.log(format!("⚪ Page item #{} is not a PLC-Diagram (skipped)", total_pages_processed), LogLevel::Debug).await;
+                        self.log(format!("⚠️ No content extracted from PLC page #{}", pages_attempted), LogLevel::Warning).await;
                     }
                 }
-
-                // Small delay between items to avoid overwhelming the browser
-                tokio::time::sleep(tokio::time::Duration::from_millis(100)).await;
             }
 
             // Scroll down for next batch of items
             self.log(format!("⬇️ Scrolling down for next batch (iteration #{})...", scroll_iteration), LogLevel::Debug).await;
-            if let Err(e) = self.browser.execute_script("arguments[0].scrollTop += 400", vec![scroll_container.clone()]).await {
-                self.log(format!("❌ Could not scroll down: {}", e), LogLevel::Warning).await;
-                break;
-            }
-            tokio::time::sleep(tokio::time::Duration::from_millis(500)).await;
+            let new_height = match self.browser.execute_async_script_with_args(SCROLL_STEP_JS, vec![serde_json::json!(scroll_container)]).await {
+                Ok(value) => value,
+                Err(e) => {
+                    self.log(format!("❌ Could not scroll down: {}", e), LogLevel::Warning).await;
+                    break;
+                }
+            };
 
             // Check if reached bottom
-            if let Ok(new_height) = self.browser.execute_script_and_get_value("return arguments[0].scrollTop", vec![scroll_container.clone()]).await {
-                if let Some(height_num) = new_height.as_i64() {
-                    self.log(format!("📏 Current scroll position: {} (previous: {})", height_num, last_height), LogLevel::Debug).await;
+            if let Some(height_num) = new_height.as_i64() {
+                self.log(format!("📏 Current scroll position: {} (previous: {})", height_num, last_height), LogLevel::Debug).await;
 
-                    if height_num == last_height {
-                        self.log("🏁 Reached bottom of scroll container - extraction complete!".to_string(), LogLevel::Info).await;
-                        break; // reached bottom
-                    }
-                    last_height = height_num;
-                } else {
-                    self.log("⚠️ Could not get scroll height, assuming bottom reached".to_string(), LogLevel::Warning).await;
-                    break;
+                if height_num == last_height {
+                    self.log("🏁 Reached bottom of scroll container - extraction complete!".to_string(), LogLevel::Info).await;
+                    break; // reached bottom
                 }
+                last_height = height_num;
             } else {
-                self.log("❌ Could not execute scroll height script, stopping".to_string(), LogLevel::Error).await;
+                self.log("⚠️ Could not get scroll height, assuming bottom reached".to_string(), LogLevel::Warning).await;
                 break;
             }
         }
@@ -888,22 +872,12 @@ impl ScraperEngine {
         self.log("📊 EXTRACTION SUMMARY:".to_string(), LogLevel::Info).await;
         self.log(format!("   📋 Total pages scanned: {}", total_pages_processed), LogLevel::Info).await;
         self.log(format!("   🎯 PLC-Diagram pages found: {}", plc_diagram_pages.len()), LogLevel::Info).await;
-        self.log(format!("   📄 Pages with extracted content: {}", extracted_page_texts.len()), LogLevel::Info).await;
+        self.log(format!("   📄 Pages with extracted content: {}", pages_with_content), LogLevel::Info).await;
         self.log(format!("   🔄 Scroll iterations: {}", scroll_iteration), LogLevel::Info).await;
 
-        if !extracted_page_texts.is_empty() {
-            // Save extracted content to JSON file for debugging
-            if let Err(e) = self.save_extracted_pages_to_json(&extracted_page_texts).await {
-                self.log(format!("⚠️ Failed to save extracted_pages.json: {}", e), LogLevel::Warning).await;
-            } else {
-                self.log("✅ Results saved to extracted_pages.json for debugging".to_string(), LogLevel::Success).await;
-            }
-
-            // Parse and add entries to table
-            self.log("⚙️ Parsing extracted content and building table...".to_string(), LogLevel::Info).await;
-            for (i, page_text) in extracted_page_texts.iter().enumerate() {
-                self.log(format!("⚙️ Parsing page {} of {}...", i+1, extracted_page_texts.len()), LogLevel::Debug).await;
-                self.parse_and_add_to_table(page_text, &mut table).await;
+        if pages_with_content > 0 {
+            if pages_file.is_some() {
+                self.log(format!("✅ Results saved to {} for debugging", EXTRACTED_PAGES_FILE), LogLevel::Success).await;
             }
 
             self.log(format!("✅ Final table contains {} entries", table.entries.len()), LogLevel::Success).await;
@@ -916,63 +890,33 @@ impl ScraperEngine {
         Ok(!plc_diagram_pages.is_empty())
     }
 
-    async fn wait_for_svg_content(&self) -> Result<()> {
-        // Try to wait for SVG content to load (similar to Python WebDriverWait)
-        for _ in 0..10 { // 5 second timeout
-            if let Ok(_) = self.browser.find_element(thirtyfour::By::Tag("svg")).await {
-                return Ok(());
-            }
-            tokio::time::sleep(tokio::time::Duration::from_millis(500)).await;
+    /// Opens the page list items at `indices` and returns the SVG texts of each page, `None`
+    /// for items that no longer exist. May return fewer pages than requested (see [`EXTRACT_PAGES_JS`]).
+    async fn extract_page_batch(&self, indices: &[usize]) -> Result<Vec<Option<Vec<String>>>> {
+        let value = self.browser.execute_async_script_with_args(EXTRACT_PAGES_JS, vec![serde_json::json!(indices)]).await?;
+        if let Some(error) = value.get("error") {
+            return Err(anyhow::anyhow!("Page batch script failed: {}", error));
         }
-        Err(anyhow::anyhow!("SVG content not found"))
+        Ok(serde_json::from_value(value)?)
     }
 
-    async fn extract_current_plc_diagram_page(&self) -> Result<String> {
+    /// Turns the SVG texts of one PLC page into entries.
+    async fn entries_from_svg_texts(&mut self, svg_texts: Vec<String>) -> Vec<PlcEntry> {
         // This method should match Python extract_current_plc_diagram_page_advanced()
         let mut extracted_content = Vec::new();
 
-        // Try to extract content (Python line 1032-1056)
-        match self.browser.get_page_source().await {
-            Ok(page_source) => {
-                // Use regex patterns exactly like Python (line 1038-1042)
-                let text_pattern = regex::Regex::new(r"<text[^>]*>([^<]+)</text>").unwrap();
-                let tspan_pattern = regex::Regex::new(r"<tspan[^>]*>([^<]+)</tspan>").unwrap();
-
-                // Find text matches (Python line 1039)
-                for capture in text_pattern.captures_iter(&page_source) {
-                    if let Some(text_match) = capture.get(1) {
-                        extracted_content.push(text_match.as_str().to_string());
-                    }
-                }
-
-                // Extend with tspan matches (Python line 1041-1042)
-                for capture in tspan_pattern.captures_iter(&page_source) {
-                    if let Some(text_match) = capture.get(1) {
-                        extracted_content.push(text_match.as_str().to_string());
-                    }
-                }
+        if !svg_texts.is_empty() {
+            self.log(format!("Found {} SVG text nodes", svg_texts.len()), LogLevel::Debug).await;
 
-                if !extracted_content.is_empty() {
-                    self.log(format!("Regex found {} text matches", extracted_content.len()), LogLevel::Debug).await;
-
-                    // Filter content (Python line 1047-1053)
-                    let mut filtered_content = Vec::new();
-                    for text in extracted_content {
-                        let trimmed = text.trim();
-                        if !trimmed.is_empty() && trimmed.len() > 2 {
-                            // Filter out unwanted elements (Python line 1050-1052)
-                            if !["Date", "Datum", "ET 200SP"].iter().any(|skip| trimmed.contains(skip)) {
-                                filtered_content.push(trimmed.to_string());
-                            }
-                        }
+            // Filter content (Python line 1047-1053)
+            for text in svg_texts {
+                if text.len() > 2 {
+                    // Filter out unwanted elements (Python line 1050-1052)
+                    if !skip_text_regex().is_match(&text) {
+                        extracted_content.push(text);
                     }
-                    extracted_content = filtered_content;
                 }
             }
-            Err(e) => {
-                self.log(format!("Page source extraction failed: {}", e), LogLevel::Error).await;
-                return Ok(String::new());
-            }
         }
 
         if !extracted_content.is_empty() {
@@ -987,24 +931,21 @@ impl ScraperEngine {
                 }
             }
 
-            let result = unique_content.join(" ");
             self.log(format!("Successfully extracted {} unique text elements", unique_content.len()), LogLevel::Success).await;
 
-            // Parse the data (Python line 1071-1073)
+            // Parse the data (Python line 1071-1073), one text node per line
             self.log("TRYING TO CALL PARSE".to_string(), LogLevel::Debug).await;
-            let parsed_data = self.parse_plc_data(&result);
-
-            // Format result like Python (line 1073: "; ".join(" ".join(d.values()) for d in parsed_data))
-            let result_string = parsed_data.into_iter()
-                .map(|entry| format!("{} {}", entry.address, entry.symbol_name))
-                .collect::<Vec<_>>()
-                .join("; ");
-
-            Ok(result_string)
+            Self::parse_plc_data(&unique_content)
         } else {
             self.log("No content could be extracted with any method".to_string(), LogLevel::Error).await;
 
-            // Debug: Save page source for manual analysis (Python line 1079-1087)
+            // Debug: Save page source for manual analysis (Python line 1079-1087), only for
+            // the first few empty pages so a broken page load does not fill the disk
+            if self.debug_dumps_remaining == 0 {
+                return Vec::new();
+            }
+            self.debug_dumps_remaining -= 1;
+
             if let Ok(page_source) = self.browser.get_page_source().await {
                 let debug_file = format!("debug_page_source_{}.html", chrono::Utc::now().format("%Y%m%d_%H%M%S"));
                 if std::fs::write(&debug_file, &page_source).is_ok() {
@@ -1012,38 +953,45 @@ impl ScraperEngine {
                 }
             }
 
-            Ok(String::new())
+            Vec::new()
         }
     }
 
-    async fn save_extracted_pages_to_json(&self, pages: &[String]) -> Result<()> {
-        let json_content = serde_json::to_string_pretty(pages)?;
-        std::fs::write("extracted_pages.json", json_content)?;
-        Ok(())
+    /// Formats a page's entries like Python (line 1073: "; ".join(" ".join(d.values()) for d in parsed_data)).
+    /// Only used for the debug JSON; the entries themselves go straight into the table.
+    fn format_page_entries(entries: &[PlcEntry]) -> String {
+        entries.iter()
+            .map(|entry| format!("{} {}", entry.address, entry.symbol_name))
+            .collect::<Vec<_>>()
+            .join("; ")
     }
 
-    async fn parse_and_add_to_table(&self, page_text: &str, table: &mut PlcTable) {
-        let entries = self.parse_plc_data(page_text);
-        for entry in entries {
-            table.entries.push(entry);
-        }
+    /// Appends one page as a JSON string line and flushes it, so the file is complete up to the last page.
+    fn append_extracted_page(writer: &mut std::io::BufWriter<std::fs::File>, page_text: &str) -> Result<()> {
+        use std::io::Write;
+        serde_json::to_writer(&mut *writer, page_text)?;
+        writer.write_all(b"\n")?;
+        writer.flush()?;
+        Ok(())
     }
 
-    fn parse_plc_data(&self, input_string: &str) -> Vec<PlcEntry> {
+    /// Parses PLC entries from text lines, typically the SVG text nodes of one page in
+    /// document order. Function text that is its own line applies to the addresses after it.
+    fn parse_plc_data<I>(lines: I) -> Vec<PlcEntry>
+    where
+        I: IntoIterator,
+        I::Item: AsRef<str>,
+    {
         let mut results = Vec::new();
 
-        // Split string into lines
-        let normalized = input_string.replace("\r\n", "\n").replace('\r', "\n");
-        let lines: Vec<&str> = normalized.split('\n').collect();
-
-        // Regex patterns from Python
-        let address_pattern = regex::Regex::new(r"\b([IQ]W?\d+\.\d+|[IQ]W\d+)\b").unwrap();
-        let function_pattern = regex::Regex::new(r"([A-Za-z][A-Za-z\s]+(?:\d+\.)+\d+(?:\s+[A-Z]+)?)").unwrap();
+        // Regex patterns from Python, compiled once per process
+        let address_pattern = address_regex();
+        let function_pattern = function_regex();
 
         let mut current_function = String::new();
 
         for line in lines {
-            let line = line.trim();
+            let line = line.as_ref().trim();
 
             if line.is_empty() {
                 continue;
@@ -1075,6 +1023,10 @@ impl ScraperEngine {
                         comment: String::new(),
                     });
                 }
+            } else if let Some(function_match) = function_pattern.find(line) {
+                // No address on this line; with one line per text node the function
+                // designation usually sits in the node before its address
+                current_function = function_match.as_str().trim().to_string();
             }
         }
 
@@ -1090,4 +1042,57 @@ impl ScraperEngine {
 
         Ok(())
     }
-}
\ No newline at end of file
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_xpath_literal_without_quotes() {
+        assert_eq!(xpath_literal("P-4711"), "'P-4711'");
+    }
+
+    #[test]
+    fn test_xpath_literal_with_single_quote() {
+        assert_eq!(xpath_literal("O'Brien"), "\"O'Brien\"");
+    }
+
+    #[test]
+    fn test_xpath_literal_with_both_quotes() {
+        assert_eq!(xpath_literal("a'b\"c"), "concat('a', \"'\", 'b\"c')");
+    }
+
+    #[test]
+    fn test_parse_plc_data_sample() {
+        let input = "Motor 1.2 ON I1.0\nQW64\r\nPump -K1 I2.1";
+
+        let entries = ScraperEngine::parse_plc_data(input.lines());
+        let pairs: Vec<(&str, &str)> = entries.iter()
+            .map(|entry| (entry.address.as_str(), entry.symbol_name.as_str()))
+            .collect();
+
+        assert_eq!(pairs, vec![
+            ("I1.0", "Motor 1.2 ON"),
+            ("QW64", "Motor 1.2 ON"),
+            ("I2.1", "Pump -K1"),
+        ]);
+    }
+
+    #[test]
+    fn test_parse_plc_data_without_function() {
+        // An address with nothing in front of it and no function seen yet is dropped
+        assert!(ScraperEngine::parse_plc_data(["I1.0", "", "  "]).is_empty());
+    }
+
+    #[test]
+    fn test_parse_plc_data_function_in_separate_node() {
+        let nodes = vec!["Valve 2.1 OPEN".to_string(), "Q4.0".to_string(), "Q4.1".to_string()];
+
+        let entries = ScraperEngine::parse_plc_data(&nodes);
+
+        assert_eq!(entries.len(), 2);
+        assert!(entries.iter().all(|entry| entry.symbol_name == "Valve 2.1 OPEN"));
+        assert_eq!(entries[1].address, "Q4.1");
+    }
+}
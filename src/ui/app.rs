@@ -5,6 +5,7 @@ use crate::ui::table_view::TableView;
 use crate::ui::themes;
 use crate::chromedriver_manager::ChromeDriverManager;
 use eframe::egui;
+use std::collections::VecDeque;
 use std::sync::Arc;
 use tokio::sync::{Mutex, mpsc};
 use chrono;
@@ -17,7 +18,7 @@ pub struct EviewApp {
     is_extracting: bool,
 
     // Enhanced logging system
-    log_messages: Vec<LogEntry>,
+    log_messages: VecDeque<LogEntry>,
     log_text_buffer: String, // For the text editor
     log_filter_level: LogLevel,
     log_auto_scroll: bool,
@@ -134,7 +135,7 @@ impl EviewApp {
             is_extracting: false,
 
             // Enhanced logging system
-            log_messages: Vec::new(),
+            log_messages: VecDeque::new(),
             log_text_buffer: String::new(),
             log_filter_level: LogLevel::Info,
             log_auto_scroll: true,
@@ -162,33 +163,51 @@ impl EviewApp {
             level,
         };
 
-        self.log_messages.push(log_entry);
-        self.update_log_buffer();
+        // Append to the text buffer instead of rebuilding it; extraction logs hundreds
+        // of lines and a full rebuild per line reformats every retained entry
+        if self.should_show_log_level(&log_entry.level) {
+            if !self.log_text_buffer.is_empty() {
+                self.log_text_buffer.push('\n');
+            }
+            let line = self.format_log_entry(&log_entry);
+            self.log_text_buffer.push_str(&line);
+        }
+        self.log_messages.push_back(log_entry);
 
         // Keep only last 1000 messages
         if self.log_messages.len() > 1000 {
-            self.log_messages.remove(0);
-            self.update_log_buffer();
+            if let Some(removed) = self.log_messages.pop_front() {
+                if self.should_show_log_level(&removed.level) {
+                    // Drop the oldest line plus its separator (messages may span lines). Only
+                    // cut if the buffer really starts with that line, so the cut is on a char
+                    // boundary; otherwise rebuild it from the retained entries.
+                    let removed_line = self.format_log_entry(&removed);
+                    if self.log_text_buffer.starts_with(&removed_line) {
+                        let removed_len = (removed_line.len() + 1).min(self.log_text_buffer.len());
+                        self.log_text_buffer.drain(..removed_len);
+                    } else {
+                        self.update_log_buffer();
+                    }
+                }
+            }
         }
     }
 
+    fn format_log_entry(&self, entry: &LogEntry) -> String {
+        let timestamp = if self.show_timestamps {
+            format!("[{}] ", entry.timestamp.format("%H:%M:%S"))
+        } else {
+            String::new()
+        };
+        let icon = entry.level.icon();
+        format!("{}{} {}", timestamp, icon, entry.message)
+    }
+
     fn update_log_buffer(&mut self) {
-        let filtered_messages: Vec<_> = self.log_messages
+        self.log_text_buffer = self.log_messages
             .iter()
             .filter(|entry| self.should_show_log_level(&entry.level))
-            .collect();
-
-        self.log_text_buffer = filtered_messages
-            .iter()
-            .map(|entry| {
-                let timestamp = if self.show_timestamps {
-                    format!("[{}] ", entry.timestamp.format("%H:%M:%S"))
-                } else {
-                    String::new()
-                };
-                let icon = entry.level.icon();
-                format!("{}{} {}", timestamp, icon, entry.message)
-            })
+            .map(|entry| self.format_log_entry(entry))
             .collect::<Vec<_>>()
             .join("\n");
     }
@@ -697,7 +716,7 @@ impl EviewApp {
                         if ui.checkbox(&mut self.config.headless_mode, "Headless mode (browser runs in background)").changed() {
                             let _ = self.config.save();
                         }
-                        if ui.checkbox(&mut self.config.debug_mode, "Debug mode (keep browser open on errors)").changed() {
+                        if ui.checkbox(&mut self.config.debug_mode, "Debug mode (verbose logs, keep browser open on errors)").changed() {
                             let _ = self.config.save();
                         }
                     });
@@ -949,7 +968,8 @@ impl EviewApp {
             // Resizable text area
             let text_response = ui.add_sized(
                 [ui.available_width(), log_height],
-                egui::TextEdit::multiline(&mut self.log_text_buffer)
+                // Read-only view (a &str buffer) so the text always matches log_messages
+                egui::TextEdit::multiline(&mut self.log_text_buffer.as_str())
                     .font(egui::TextStyle::Monospace)
                     .desired_rows(10)
                     .desired_width(f32::INFINITY)
@@ -1124,6 +1144,7 @@ impl EviewApp {
             password: config.password().to_string(),
             project_number: config.project_number.clone(),
             headless: config.headless_mode,
+            debug: config.debug_mode,
         };
 
         let debug_mode = config.debug_mode;
@@ -1412,9 +1433,10 @@ impl eframe::App for EviewApp {
         // Process progress updates from async extraction
         self.process_progress_updates();
 
-        // Request repaint if extracting to ensure UI updates
+        // Poll the progress channel while extracting; a short interval keeps the UI
+        // responsive without redrawing every frame at full speed
         if self.is_extracting {
-            ctx.request_repaint();
+            ctx.request_repaint_after(std::time::Duration::from_millis(50));
         }
 
         // Apply professional theme (light or dark)